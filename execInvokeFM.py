@@ -10,14 +10,33 @@ on the target system. Supports function modules with parameters via JSON files.
 import sys
 import argparse
 import os
+import re
 import json
+import atexit
+import threading
+import time
+import pickle
+from queue import Queue, Empty
 from configparser import ConfigParser
 from typing import Dict, List, Optional, Union, Set, Tuple
 from collections import defaultdict
+from operator import itemgetter
+import dataclasses
 from dataclasses import dataclass
-from functools import lru_cache
 from pyrfc import Connection, RFCError, ABAPApplicationError, LogonError, CommunicationError
 
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps_indented(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_indented(value) -> str:
+        return json.dumps(value, indent=2)
+
 BANNER = """
     ██╗███╗   ██╗██╗   ██╗ ██████╗ ██╗  ██╗███████╗██████╗ ███████╗███╗   ███╗
     ██║████╗  ██║██║   ██║██╔═══██╗██║ ██╔╝██╔════╝██╔══██╗██╔════╝████╗ ████║
@@ -32,11 +51,22 @@ BANNER = """
     ====================================================
 """
 
+CONN_POOL_MAX_SIZE = 4
+METADATA_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sapinvokefm')
+METADATA_CACHE_TTL = 24 * 60 * 60
+
+# ANSI colors only when writing to a terminal
+_USE_COLOR = sys.stdout.isatty()
+
+# Function parameter directions that accept values from the import file
+INPUT_DIRECTIONS = ('RFC_IMPORT', 'RFC_CHANGING', 'RFC_TABLES')
+INT_TYPES = ('RFCTYPE_INT', 'RFCTYPE_INT1', 'RFCTYPE_INT2', 'RFCTYPE_INT8')
+
 def print_banner():
     """Print the ASCII art banner."""
     print(Colors.format(BANNER, 'cyan'))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionParams:
     """Connection parameters data class"""
     user: str
@@ -47,11 +77,17 @@ class ConnectionParams:
     saprouter: Optional[str] = None
     dest: Optional[str] = None
     lang: Optional[str] = None
+    _as_dict: Dict[str, str] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_as_dict', {
+            f.name: getattr(self, f.name) for f in dataclasses.fields(self)
+            if f.init and getattr(self, f.name) is not None and f.name not in ('dest', 'lang')
+        })
 
     def to_dict(self) -> Dict[str, str]:
-        """Convert to dictionary format for Connection class."""
-        return {k: v for k, v in self.__dict__.items() 
-                if v is not None and k not in ['dest', 'lang']}
+        """Dictionary format for Connection class, computed once. Do not modify."""
+        return self._as_dict
 
 class Colors:
     """ANSI color codes"""
@@ -67,19 +103,28 @@ class Colors:
 
     @classmethod
     def format(cls, text: str, color: str) -> str:
+        if not _USE_COLOR:
+            return text
         return f"{cls.COLORS.get(color, '')}{text}{cls.COLORS['reset']}"
 
+def _log_affixes(color: str, tag: str) -> Tuple[str, str]:
+    """Precompute a log line's prefix and suffix; no ANSI codes when stdout is piped."""
+    if _USE_COLOR:
+        return Colors.COLORS[color] + tag, Colors.COLORS['reset'] + '\n'
+    return tag, '\n'
+
 class Logger:
-    _loggers = {
-        'info': lambda msg: print(Colors.format(f"[*] {msg}", 'cyan')),
-        'success': lambda msg: print(Colors.format(f"[+] {msg}", 'green')),
-        'warning': lambda msg: print(Colors.format(f"[!] {msg}", 'yellow')),
-        'error': lambda msg: print(Colors.format(f"[-] {msg}", 'red'))
+    _PREFIX = {
+        'info': _log_affixes('cyan', '[*] '),
+        'success': _log_affixes('green', '[+] '),
+        'warning': _log_affixes('yellow', '[!] '),
+        'error': _log_affixes('red', '[-] ')
     }
 
     @classmethod
     def log(cls, level: str, message: str) -> None:
-        cls._loggers.get(level, cls._loggers['info'])(message)
+        prefix, suffix = cls._PREFIX.get(level, cls._PREFIX['info'])
+        sys.stdout.write(prefix + message + suffix)
 
     @classmethod
     def info(cls, message: str) -> None:
@@ -97,12 +142,94 @@ class Logger:
     def error(cls, message: str) -> None:
         cls.log('error', message)
 
+class ConnectionPool:
+    """Pool of live RFC connections keyed by endpoint"""
+    def __init__(self, max_size: int = CONN_POOL_MAX_SIZE):
+        self.max_size = max_size
+        self._idle: Dict[Tuple[str, ...], Queue] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(params_dict: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(params_dict.get(k, '') for k in ('ashost', 'sysnr', 'client', 'user'))
+
+    def _queue(self, key: Tuple[str, ...]) -> Queue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = Queue()
+            return self._idle[key]
+
+    def acquire(self, conn_params: ConnectionParams) -> Connection:
+        """Return an idle connection that still answers a ping, or open a new one."""
+        params_dict = conn_params.to_dict()
+        idle = self._queue(self._key(params_dict))
+        while True:
+            try:
+                connection = idle.get_nowait()
+            except Empty:
+                break
+            try:
+                connection.ping()
+                return connection
+            except (CommunicationError, RFCError):
+                self.evict(connection)
+        return Connection(**params_dict)
+
+    def release(self, connection: Connection, conn_params: ConnectionParams) -> None:
+        """Hand a connection back; close it if max_size connections are already idle."""
+        idle = self._queue(self._key(conn_params.to_dict()))
+        with self._lock:
+            keep = idle.qsize() < self.max_size
+            if keep:
+                idle.put_nowait(connection)
+        if not keep:
+            self.evict(connection)
+
+    def resize(self, max_size: int) -> None:
+        """Change the idle limit for all endpoints, closing any surplus connections."""
+        with self._lock:
+            self.max_size = max_size
+            queues = list(self._idle.values())
+        for idle in queues:
+            while idle.qsize() > max(max_size, 0):
+                try:
+                    self.evict(idle.get_nowait())
+                except Empty:
+                    break
+
+    @staticmethod
+    def evict(connection: Connection) -> None:
+        try:
+            connection.close()
+        except RFCError:
+            pass
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            queues, self._idle = list(self._idle.values()), {}
+        for idle in queues:
+            while True:
+                try:
+                    self.evict(idle.get_nowait())
+                except Empty:
+                    break
+
+_pool = ConnectionPool()
+atexit.register(_pool.close)
+
 class SAPConnection:
     """SAP connection handler"""
-    def __init__(self, conn_params: ConnectionParams):
+    def __init__(self, conn_params: ConnectionParams, pool: Optional[ConnectionPool] = None,
+                 refresh_meta: bool = False):
         self.conn_params = conn_params
+        self.pool = pool or _pool
+        self.refresh_meta = refresh_meta
         self.connection = None
+        self._connection_used = False
+        self.sys_id = None
         self._metadata_cache = {}
+        self._fetched_desc = set()
 
     def __enter__(self):
         self.connect()
@@ -118,17 +245,102 @@ class SAPConnection:
                    f"(sys: {params_dict['sysnr']}, client: {params_dict['client']})...")
 
         try:
-            self.connection = Connection(**params_dict)
+            self.connection = self.pool.acquire(self.conn_params)
+            self._connection_used = False
             system_info = self.connection.get_connection_attributes()
+            self.sys_id = system_info.get('sysId')
             Logger.success(f"Connected to SAP system: {system_info.get('sysId', 'Unknown')}")
         except (LogonError, CommunicationError, RFCError) as e:
             Logger.error(f"Connection error: {str(e)}")
             sys.exit(1)
 
     def close(self) -> None:
+        """Return the connection to the pool; sockets are closed at exit."""
         if self.connection:
-            self.connection.close()
-            Logger.info("SAP connection closed")
+            self.pool.release(self.connection, self.conn_params)
+            self.connection = None
+            Logger.info("SAP connection released")
+
+    def _call(self, function_name: str, **params):
+        """Call a function module on a live connection.
+
+        A connection that already served a call is pinged first and replaced
+        if the link dropped. The call itself is never retried: once the
+        request is sent, SAP may have run the function module.
+        """
+        if self._connection_used:
+            try:
+                self.connection.ping()
+            except CommunicationError as e:
+                Logger.warning(f"Connection lost ({str(e)}), reconnecting before the call")
+                self.pool.evict(self.connection)
+                self.connection = None
+                self.connection = self.pool.acquire(self.conn_params)
+        self._connection_used = True
+        return self.connection.call(function_name, **params)
+
+    def _metadata_file(self) -> Optional[str]:
+        """Cache file per system and endpoint, since several hosts can share a SID."""
+        if not self.sys_id:
+            return None
+        endpoint = re.sub(r'[^\w.-]', '_', f"{self.conn_params.ashost}_{self.conn_params.sysnr}")
+        return os.path.join(METADATA_CACHE_DIR, f"meta_{self.sys_id}_{endpoint}.pkl")
+
+    def _load_metadata_file(self) -> Dict:
+        """Load the on-disk metadata cache, ignoring it if missing or unreadable."""
+        path = self._metadata_file()
+        if not path or not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _store_metadata_file(self, function_name: str, func_desc) -> None:
+        path = self._metadata_file()
+        if not path:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            data = self._load_metadata_file()
+            data[function_name] = (time.time(), func_desc)
+            os.makedirs(METADATA_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            Logger.warning(f"Could not write metadata cache: {str(e)}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _get_desc(self, function_name: str, refresh: bool = False):
+        """Get function description from memory, then disk, then the SAP system.
+
+        With refresh=True both cache tiers are skipped and overwritten.
+        """
+        func_desc = None if refresh else self._metadata_cache.get(function_name)
+        if func_desc is not None:
+            return func_desc
+
+        if not (self.refresh_meta or refresh):
+            entry = self._load_metadata_file().get(function_name)
+            # Anything but a fresh (timestamp, description) pair is a cache miss
+            if (isinstance(entry, tuple) and len(entry) == 2
+                    and isinstance(entry[0], (int, float))
+                    and hasattr(entry[1], 'parameters')
+                    and time.time() - entry[0] <= METADATA_CACHE_TTL):
+                func_desc = entry[1]
+        if func_desc is None:
+            func_desc = self.connection.get_function_description(function_name)
+            if func_desc:
+                self._fetched_desc.add(function_name)
+                self._store_metadata_file(function_name, func_desc)
+        if func_desc:
+            self._metadata_cache[function_name] = func_desc
+        return func_desc
 
     def get_function_metadata(self, function_name: str) -> bool:
         """Display function module metadata."""
@@ -138,7 +350,7 @@ class SAPConnection:
         Logger.info(f"Getting function description for: {function_name}")
         
         try:
-            func_desc = self.connection.get_function_description(function_name)
+            func_desc = self._get_desc(function_name)
             if not func_desc:
                 Logger.error(f"Could not retrieve description for function {function_name}")
                 return False
@@ -165,50 +377,49 @@ class SAPConnection:
                 "parameter_text",
             ]
             parameter_widths = [20, 17, 11, 10, 9, 9, 15, 10, 15, 20]
-            
-            # Print header
-            print(" ".join(key.upper().ljust(width) for key, width in zip(parameter_keys, parameter_widths)))
+            parameter_columns = list(zip(parameter_keys, parameter_widths))
+
+            field_keys = [
+                "name",
+                "field_type",
+                "nuc_length",
+                "nuc_offset",
+                "uc_length",
+                "uc_offset",
+                "decimals",
+                "type_description",
+            ]
+            field_widths = [20, 17, 10, 10, 9, 9, 10, 15]
+            field_columns = list(zip(field_keys, field_widths))
+            field_header = "    " + " ".join(f"{key.upper():<{width}}" for key, width in field_columns)
+            separator = "-" * sum(parameter_widths)
+
+            # Collect output and write it in one go
+            out: List[str] = [" ".join(f"{key.upper():<{width}}" for key, width in parameter_columns)]
 
-            # Print each parameter
             for parameter in sorted(func_desc.parameters, key=parameter_key_function):
-                # Print parameter row
+                # Parameter row
                 row = []
-                for key, width in zip(parameter_keys, parameter_widths):
+                for key, width in parameter_columns:
                     value = parameter[key]
                     if key == "type_description" and value is not None:
                         value = value.name
-                    row.append(str(value).ljust(width))
-                print(" ".join(row))
-                
+                    row.append(f"{value!s:<{width}}")
+                out.append(" ".join(row))
+
                 # If parameter has a complex structure, display its details
                 type_desc = parameter["type_description"]
                 if type_desc is not None:
-                    field_keys = [
-                        "name",
-                        "field_type",
-                        "nuc_length",
-                        "nuc_offset",
-                        "uc_length",
-                        "uc_offset",
-                        "decimals",
-                        "type_description",
-                    ]
-                    field_widths = [20, 17, 10, 10, 9, 9, 10, 15]
-
-                    print(f"    -----------( Structure of {type_desc.name} "
-                          f"(n/uc_length={type_desc.nuc_length}/{type_desc.uc_length})--")
-                    
-                    # Print field header
-                    print("    " + " ".join(key.upper().ljust(width) for key, width in zip(field_keys, field_widths)))
-
-                    # Print fields
+                    out.append(f"    -----------( Structure of {type_desc.name} "
+                               f"(n/uc_length={type_desc.nuc_length}/{type_desc.uc_length})--")
+                    out.append(field_header)
                     for field in type_desc.fields:
-                        print("    " + " ".join(str(field[key]).ljust(width) for key, width in zip(field_keys, field_widths)))
+                        out.append("    " + " ".join(f"{field[key]!s:<{width}}" for key, width in field_columns))
+                    out.append(f"    -----------( Structure of {type_desc.name} )-----------")
 
-                    print(f"    -----------( Structure of {type_desc.name} )-----------")
-                
-                print("-" * sum(parameter_widths))
-            
+                out.append(separator)
+
+            sys.stdout.write("\n".join(out) + "\n")
             return True
             
         except RFCError as e:
@@ -229,7 +440,11 @@ class SAPConnection:
         import_params = import_params or {}
 
         try:
-            result = self.connection.call(function_name, **import_params)
+            import_params = self._validate_params(function_name, import_params)
+            if import_params is None:
+                return False
+
+            result = self._call(function_name, **import_params)
             Logger.success(f"Function module '{function_name}' called successfully")
             
             if result:
@@ -239,64 +454,142 @@ class SAPConnection:
             Logger.error(f"Function execution error: {str(e)}")
             return False
 
+    def _validate_params(self, function_name: str, import_params: Dict) -> Optional[Dict]:
+        """Check parameters against the function interface before calling it.
+
+        Returns the parameters with numeric values coerced to their ABAP type,
+        or None if they do not match the interface. A cached description that
+        rejects the parameters is fetched again from SAP before giving up, in
+        case the interface changed.
+        """
+        try:
+            func_desc = self._get_desc(function_name)
+            if not func_desc:
+                return import_params
+            params, errors = self._check_params(func_desc, import_params)
+            if errors and function_name not in self._fetched_desc:
+                func_desc = self._get_desc(function_name, refresh=True)
+                if not func_desc:
+                    return import_params
+                params, errors = self._check_params(func_desc, import_params)
+        except RFCError as e:
+            Logger.warning(f"Skipping parameter validation: {str(e)}")
+            return import_params
+
+        if errors:
+            Logger.error(f"Invalid parameters for '{function_name}': {'; '.join(errors)}")
+            return None
+        return params
+
+    @staticmethod
+    def _check_params(func_desc, import_params: Dict) -> Tuple[Dict, List[str]]:
+        """Coerce parameters to the interface and list any mismatches."""
+        inputs = {p["name"]: p for p in func_desc.parameters
+                  if p["direction"] in INPUT_DIRECTIONS}
+        errors = [f"unknown parameter '{name}'" for name in import_params if name not in inputs]
+        errors.extend(f"missing required parameter '{name}'" for name, p in inputs.items()
+                      if p["direction"] == 'RFC_IMPORT'
+                      and not p["optional"] and name not in import_params)
+
+        params = {}
+        for name, value in import_params.items():
+            param_type = inputs[name]["parameter_type"] if name in inputs else None
+            if param_type in INT_TYPES:
+                if isinstance(value, str) and re.fullmatch(r'-?[0-9]+', value):
+                    value = int(value)
+                elif isinstance(value, bool) or not isinstance(value, int):
+                    errors.append(f"parameter '{name}' expects {param_type}, got {value!r}")
+            elif param_type == 'RFCTYPE_NUM':
+                length = inputs[name]["nuc_length"]
+                if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                    digits = str(value)
+                elif isinstance(value, str) and value.isascii() and value.isdigit():
+                    digits = value
+                else:
+                    digits = None
+                if digits is None or len(digits) > length:
+                    errors.append(f"parameter '{name}' expects up to {length} digits, got {value!r}")
+                else:
+                    value = digits.zfill(length)
+            params[name] = value
+        return params, errors
+
     def _process_results(self, result: Dict, params_to_capture: Optional[Set[str]]) -> None:
         """Process results"""
         if not params_to_capture:
-            self._display_all_results(result)
+            self._display(result, "Function returned the following data:")
             return
 
-        captured_results = defaultdict(list)
+        # Split capture specs once: TABLE[FIELD] specs vs plain parameter names
+        table_specs = []
+        scalar_specs = []
         for param in params_to_capture:
             if '[' in param and param.endswith(']'):
                 table_name, field = param.split('[', 1)
-                field = field.rstrip(']')
-                if table_name in result and isinstance(result[table_name], list):
-                    captured_results[param].extend(
-                        row.get(field) or row.get("WA")
-                        for row in result[table_name]
-                        if isinstance(row, dict)
-                    )
-            elif param in result:
-                captured_results[param] = result[param]
+                table_specs.append((param, table_name, field.rstrip(']')))
+            else:
+                scalar_specs.append(param)
 
-        self._display_captured_results(captured_results)
+        captured_results = defaultdict(list)
+        for param, table_name, field in table_specs:
+            rows = result.get(table_name)
+            if isinstance(rows, list):
+                getter = itemgetter(field)
+                values = captured_results[param]
+                for row in rows:
+                    if isinstance(row, dict):
+                        try:
+                            values.append(getter(row) or row.get("WA"))
+                        except KeyError:
+                            values.append(row.get("WA"))
+        for param in scalar_specs:
+            if param in result:
+                captured_results[param] = result[param]
 
-    def _display_all_results(self, result: Dict) -> None:
-        Logger.info("Function returned the following data:")
-        for key, value in result.items():
-            formatted_value = (json.dumps(value, indent=2) 
-                             if isinstance(value, (list, dict)) 
-                             else value)
-            print(f"  {key}: {formatted_value}")
+        self._display(captured_results, "Function returned the following requested data:")
 
-    def _display_captured_results(self, results: Dict) -> None:
-        Logger.info("Function returned the following requested data:")
+    def _display(self, results: Dict, header: str) -> None:
+        """Print results; lists and dicts are shown as indented JSON."""
+        Logger.info(header)
+        write = sys.stdout.write
+        dumps = json_dumps_indented
+        structured = (list, dict)
         for key, value in results.items():
-            formatted_value = (json.dumps(value, indent=2) 
-                             if isinstance(value, (list, dict)) 
-                             else value)
-            print(f"  {key}: {formatted_value}")
+            # Serialize before writing so a failure leaves no partial line
+            formatted = dumps(value) if isinstance(value, structured) else value
+            write(f"  {key}: {formatted}\n")
 
 class ConfigManager:
     def __init__(self):
         self._config_cache = {}
         self._json_cache = {}
 
-    @lru_cache(maxsize=32)
+    @staticmethod
+    def _file_key(file_path: str) -> Tuple[str, int, int]:
+        """Cache key that changes whenever the file is modified."""
+        st = os.stat(file_path)
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+
     def load_config(self, config_file: str, dest: Optional[str] = None) -> Dict[str, str]:
-        """Load and cache configuration after initial load."""
+        """Load and cache configuration until the file changes."""
         if not os.path.isfile(config_file):
             Logger.error(f"Configuration file not found: {config_file}")
             sys.exit(1)
 
         try:
+            cache_key = self._file_key(config_file) + (dest,)
+            if cache_key in self._config_cache:
+                return self._config_cache[cache_key]
+
             config = ConfigParser()
-            config.read(config_file)
+            with open(config_file) as f:
+                config.read_file(f)
 
             if dest:
                 for section in config.sections():
                     if config.has_option(section, 'dest') and config.get(section, 'dest') == dest:
-                        return dict(config.items(section))
+                        self._config_cache[cache_key] = dict(config.items(section))
+                        return self._config_cache[cache_key]
                 Logger.error(f"Destination '{dest}' not found in config file")
                 sys.exit(1)
 
@@ -304,23 +597,28 @@ class ConfigManager:
                 Logger.error(f"No connection configurations found in {config_file}")
                 sys.exit(1)
 
-            return dict(config.items(config.sections()[0]))
+            self._config_cache[cache_key] = dict(config.items(config.sections()[0]))
+            return self._config_cache[cache_key]
         except Exception as e:
             Logger.error(f"Error reading configuration: {str(e)}")
             sys.exit(1)
 
-    @lru_cache(maxsize=32)
     def load_json(self, file_path: str) -> Dict:
-        """Load and cache JSON after initial load."""
+        """Load and cache JSON until the file changes."""
         if not os.path.isfile(file_path):
             Logger.error(f"File not found: {file_path}")
             sys.exit(1)
 
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            cache_key = self._file_key(file_path)
+            if cache_key in self._json_cache:
+                return self._json_cache[cache_key]
+
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             if not isinstance(data, dict):
                 raise ValueError("Expected a dictionary")
+            self._json_cache[cache_key] = data
             return data
         except Exception as e:
             Logger.error(f"Error reading {file_path}: {str(e)}")
@@ -351,6 +649,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('-i', '--import', dest='import_path', help='Path to JSON file containing parameters')
     parser.add_argument('-e', '--export', dest='export_path', help='Path to JSON file specifying parameters to capture')
     parser.add_argument('-d', '--desc', action='store_true', help='Show function module metadata')
+    parser.add_argument('--refresh-meta', action='store_true', help='Ignore cached function metadata and fetch it again')
 
     args = parser.parse_args()
 
@@ -376,7 +675,14 @@ def main() -> None:
 
         # Establish connection
         if args.connection:
-            conn_params = ConnectionParams(**config_manager.load_config(args.connection, args.dest))
+            config = dict(config_manager.load_config(args.connection, args.dest))
+            if 'conn_pool_max_size' in config:
+                pool_size = config.pop('conn_pool_max_size')
+                if not pool_size.isdigit() or int(pool_size) < 1:
+                    Logger.error(f"conn_pool_max_size must be a positive integer, got '{pool_size}'")
+                    sys.exit(1)
+                _pool.resize(int(pool_size))
+            conn_params = ConnectionParams(**config)
         else:
             conn_params = ConnectionParams(
                 user=args.user,
@@ -388,7 +694,7 @@ def main() -> None:
             )
 
         # Execute function with context manager
-        with SAPConnection(conn_params) as sap:
+        with SAPConnection(conn_params, refresh_meta=args.refresh_meta) as sap:
             if args.desc:
                 if not sap.get_function_metadata(args.function):
                     sys.exit(1)